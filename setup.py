@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from setuptools import setup
 
 
@@ -12,15 +14,15 @@ def merge_extras_reqs(extras_requirements, pattern):
         pattern (str): Pattern to use for selecting keys to merge.
 
     Returns:
-        list: A list of strings representing merged requirements from all of
-            the extras groups matching the pattern.
+        list: A sorted list of strings representing merged requirements from
+            all of the extras groups matching the pattern.
     """
-    requirements = []
-    for key in extras_requirements:
+    requirements = set()
+    for key, reqs in extras_requirements.items():
         if key.startswith(pattern):
-            requirements.extend(extras_requirements[key])
+            requirements.update(reqs)
 
-    return list(set(requirements))
+    return sorted(requirements)
 
 
 def read_requirements(*paths):
@@ -32,19 +34,22 @@ def read_requirements(*paths):
         paths ([str]): A list of requirements file paths
 
     Returns:
-        list: A list of requirements from all of the files
+        list: A sorted list of requirements from all of the files
     """
-    reqs = []
+    reqs = set()
     for path in paths:
-        with open(path, 'r') as f:
-            nth_reqs = f.read().splitlines()
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        # requirements files are plain ASCII, so skip text-mode decoding of
+        # the whole file and only decode the lines that survive filtering
+        for line in data.split(b'\n'):
             # remove empty lines and comments
-            filtered = filter(lambda e: e.strip() is not "", nth_reqs)
-            filtered = filter(lambda e: not e.strip().startswith('#'), filtered)
-            filtered = list(filtered)
-            reqs.extend(filtered)
+            line = line.strip()
+            if line and not line.startswith(b'#'):
+                reqs.add(line.decode('ascii'))
 
-    return list(set(reqs))
+    return sorted(reqs)
 
 
 # load package version
@@ -53,17 +58,11 @@ exec(open("useful/version/version.py").read())
 # load minimal requirements
 requirements = []
 
-# load "atomic" extras requirements
+# load "atomic" extras requirements. Every requirements/extras/*.txt file
+# automatically becomes an extra named after the file
 extras_requirements = {
-    "config": read_requirements("requirements/extras/config.txt"),
-    "resource-downloader-gs": read_requirements("requirements/extras/resource-downloader-gs.txt"),  # noqa
-    "resource-downloader-gsfs": read_requirements("requirements/extras/resource-downloader-gsfs.txt"),  # noqa
-    "resource-downloader-s3": read_requirements("requirements/extras/resource-downloader-s3.txt"),  # noqa
-    "resource-downloader-s3fs": read_requirements("requirements/extras/resource-downloader-s3fs.txt"),  # noqa
-    "resource-downloader-ssh": read_requirements("requirements/extras/resource-downloader-ssh.txt"),  # noqa
-    "resource-downloader-http": read_requirements("requirements/extras/resource-downloader-http.txt"),  # noqa
-    "resource-parser-yaml": read_requirements("requirements/extras/resource-parser-yaml.txt"),  # noqa
-    "resource-parser-numpy": read_requirements("requirements/extras/resource-parser-numpy.txt"),  # noqa
+    path.stem: read_requirements(path)
+    for path in sorted(Path("requirements/extras").glob("*.txt"))
 }
 
 # create artifical groupings for easier install on user-side
@@ -1,15 +1,38 @@
+import functools
 import os
-
-from munch import munchify
+import weakref
 
 import useful.resource
 from useful.creator import shorthand_creator
 
+_default_hook = None
+_munchify = None
 
-def get_hook(validator=None):
+# sentinel for distinguishing "variable not set" from empty values
+_MISSING = object()
+
+
+def _get_munchify():
     """
-    Get useful.resource.load compatible hook validating input dictionary and
-    creating a Munch object.
+    Import munch on first use and cache its munchify function. Importing
+    lazily keeps `import useful.config` cheap for programs that never
+    actually load a config.
+
+    Returns:
+        function: munch.munchify
+    """
+    global _munchify
+    if _munchify is None:
+        from munch import munchify
+        _munchify = munchify
+    return _munchify
+
+
+@functools.lru_cache(maxsize=32)
+def _build_hook(validator):
+    """
+    Build a useful.resource.load compatible hook from a validator. Hooks are
+    cached per validator so repeated `load` calls reuse a single closure.
 
     Args:
         validator (Callable): Callable to use for validation
@@ -17,12 +40,17 @@ def get_hook(validator=None):
     Returns:
         function: A function for validating and converting dictionary to Munch
     """
-    if validator is None:
-        validator = shorthand_creator
+    # memoized munchified outputs keyed on input object id. Entries are
+    # evicted through weakref.finalize when the input dies, so only
+    # weakref-able inputs are ever cached - plain dicts do not support weak
+    # references and always take the uncached path
+    output_cache = {}
 
     def hook(dictionary):
         """
-        Validate and munchify input dictionary.
+        Validate and munchify input dictionary. When the same (weakref-able)
+        input object is passed repeatedly, the munchified output is reused
+        instead of re-walking the whole tree.
 
         Args:
             dictionary (dict): Input to validate and munchify.
@@ -30,10 +58,44 @@ def get_hook(validator=None):
         Returns:
             Munch: Validated output.
         """
-        return munchify(validator(dictionary))
+        hash_ = id(dictionary)
+        output = output_cache.get(hash_)
+        if output is not None:
+            return output
+
+        output = _get_munchify()(validator(dictionary))
+        try:
+            weakref.finalize(dictionary, output_cache.pop, hash_, None)
+        except TypeError:
+            # without a weak reference there is no safe way to evict the
+            # entry once the input id gets recycled, so skip caching
+            return output
+
+        output_cache[hash_] = output
+        return output
     return hook
 
 
+def get_hook(validator=None):
+    """
+    Get useful.resource.load compatible hook validating input dictionary and
+    creating a Munch object.
+
+    Args:
+        validator (Callable): Callable to use for validation
+
+    Returns:
+        function: A function for validating and converting dictionary to Munch
+    """
+    if validator is None:
+        global _default_hook
+        if _default_hook is None:
+            _default_hook = _build_hook(shorthand_creator)
+        return _default_hook
+
+    return _build_hook(validator)
+
+
 def from_dict(dictionary, validator=None):
     """
     Validate and munchify dictionary using custom validator.
@@ -75,9 +137,14 @@ def from_env(environment_variable, validator=None):
 
     Returns:
         Munch: Validated output.
+
+    Raises:
+        KeyError: When the environment variable is not set
     """
-    assert environment_variable in os.environ
-    url = os.environ[environment_variable]
+    url = os.environ.get(environment_variable, _MISSING)
+    if url is _MISSING:
+        raise KeyError(f"Environment variable '{environment_variable}' is "
+                       f"not set")
     return from_url(url, validator)
 
 
@@ -1,15 +1,81 @@
 import builtins
-import collections
+import functools
 import importlib
 import logging
+import operator
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 
 _log = logging.getLogger(__name__)
 
+# sentinel for distinguishing "key missing" from stored falsy values
+_MISSING = object()
+
+# sentinel stored in the shorthand cache while a config node is being built,
+# used to detect reference cycles in the input
+_PENDING = object()
+
+# fetches both class-config keys in one C call
+_get_name_module = operator.itemgetter("name", "module")
+
+# scalar leaf types that can never produce an instance - recursing into
+# create() for these would only return them unchanged
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# builtin types are never cached by the shorthand creator - caching them
+# would only grow the cache without saving any work
+_BUILTIN_TYPES = frozenset(
+    t for t in builtins.__dict__.values() if isinstance(t, type))
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve(module_name, object_name):
+    """
+    Import a module and get an object from it. Results are cached so repeated
+    resolutions of the same (module, object) pair skip the import machinery
+    and its lock entirely.
+
+    Args:
+        module_name (str): Module to import the object from
+        object_name (str): Name of the object inside the module
+
+    Returns:
+        object: Resolved object from the imported module
+    """
+    module = importlib.import_module(module_name)
+    return getattr(module, object_name)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_dotted_key(key):
+    """
+    Parse "module.submodule.object" to 2-tuple ("module.submodule", "object").
+    In case input string contains no dots, raise an exception. Results are
+    cached since the same dotted keys tend to repeat many times within and
+    across configs.
+
+    Args:
+        key (str): An input string to parse
+
+    Returns:
+        tuple: A 2-tuple containing information about `(module, object)`
+            parsed from the input string.
+
+    Raises:
+        ValueError: In case input contains no dots
+    """
+    if '.' not in key:
+        raise ValueError(f"Input string *must* contain both module and an "
+                         f"object. String '{key}' does not.")
+
+    module, _, object_ = key.rpartition('.')
+    return module, object_
+
 
 def _is_non_string_iterable(x):
     """
-    Test whether `x` is a non-string iterable.
+    Test whether `x` is a non-string iterable. Strings and bytes are excluded
+    since unpacking them character by character is never what we want.
 
     Args:
         x (object): Test subject.
@@ -17,8 +83,12 @@ def _is_non_string_iterable(x):
     Returns:
         bool: True if non-string iterable. False otherwise
     """
-    return (isinstance(x, collections.Iterable) and
-            not isinstance(x, str))
+    # lists and tuples dominate real configs - answer for them with two
+    # pointer compares before falling back to the generic protocol checks
+    t = type(x)
+    if t is list or t is tuple:
+        return True
+    return hasattr(x, "__iter__") and not isinstance(x, (str, bytes))
 
 
 class BaseCreator(ABC):
@@ -27,6 +97,8 @@ class BaseCreator(ABC):
     pattern is used for creating instances from pure dictionaries, allowing
     complete configuration of classes used in a program.
     """
+    __slots__ = ()
+
     @abstractmethod
     def create(self, config, *args, **kwargs):
         pass
@@ -47,35 +119,29 @@ class BaseCreator(ABC):
         Returns:
             object: An instance of class `cls`
         """
+        # exact type checks are pointer compares and cover the common config
+        # shapes; the generic isinstance/iterable checks only run for
+        # subclasses and more exotic iterables
+        t = type(config)
         # if config is dictionary, unpack it using **config
-        if isinstance(config, dict):
+        if t is dict or isinstance(config, dict):
             instance = cls(**config)
-            _log.debug(f"Created instance of class '{cls.__name__}' from a "
-                       f"dictionary",
-                       extra={
-                           "class": {
-                               "module": cls.__module__,
-                               "name": cls.__name__
-                           },
-                           "config": config,
-                           "config_type": type(config)})
+            source = "a dictionary"
         # if config is an iterable but not a string, unpack it using *config
-        elif _is_non_string_iterable(config):
+        elif t is list or t is tuple or _is_non_string_iterable(config):
             instance = cls(*config)
-            _log.debug(f"Created instance of class '{cls.__name__}' from a "
-                       f"non string, non-dict iterable",
-                       extra={
-                           "class": {
-                               "module": cls.__module__,
-                               "name": cls.__name__
-                           },
-                           "config": config,
-                           "config_type": type(config)})
+            source = "a non string, non-dict iterable"
         # in any other case, do not unpack config
         else:
             instance = cls(config)
-            _log.debug(f"Created instance of class '{cls.__name__}' from a "
-                       f"single argument of type ({type(config)})",
+            source = "a single argument"
+
+        # guard the debug log so the message and extra dict are only built
+        # when debug logging is actually enabled. The __debug__ prefix lets
+        # `python -O` strip these blocks from the bytecode entirely
+        if __debug__ and _log.isEnabledFor(logging.DEBUG):
+            _log.debug(f"Created instance of class '{cls.__name__}' from "
+                       f"{source}",
                        extra={
                            "class": {
                                "module": cls.__module__,
@@ -88,6 +154,8 @@ class BaseCreator(ABC):
 
 
 class RegistryCreator(BaseCreator):
+    __slots__ = ("registry",)
+
     def __init__(self, registry):
         """
         A simple creator that requires a registry mapping from key to python
@@ -107,9 +175,12 @@ class RegistryCreator(BaseCreator):
         for the key must be a Python class.
 
         Args:
-            registry (dict): A registry mapping from keys to classes.
+            registry (dict): A registry mapping from keys to classes. The
+                creator keeps a read-only view of this dictionary - register
+                new classes by mutating the original dictionary, not through
+                the creator.
         """
-        self.registry = registry
+        self.registry = MappingProxyType(registry)
 
     def create(self, config):
         """
@@ -131,32 +202,36 @@ class RegistryCreator(BaseCreator):
         """
         assert len(config) == 1
         name, params = next(iter(config.items()))
-        if params is None:
-            params = {}
 
         # get class
-        try:
-            cls = self.registry[name]
-        except KeyError as e:
-            raise KeyError(f"Class with key '{name}' is not registered") from e
-
-        # create instance
-        instance = BaseCreator.unpack_and_create(cls, params)
-        _log.debug(f"RegistryCreator created instance "
-                   f"'{cls.__module__}.{cls.__name__}'",
-                   extra={
-                       "class": {
-                           "name": cls.__name__,
-                           "module": cls.__module__
-                       },
-                       "config": config,
-                       "params": params
-                   })
+        cls = self.registry.get(name, _MISSING)
+        if cls is _MISSING:
+            raise KeyError(f"Class with key '{name}' is not registered")
+
+        # create instance; no params at all means a plain no-argument call,
+        # skipping the dict allocation and unpacking machinery entirely
+        if params is None:
+            instance = cls()
+        else:
+            instance = BaseCreator.unpack_and_create(cls, params)
+        if __debug__ and _log.isEnabledFor(logging.DEBUG):
+            _log.debug(f"RegistryCreator created instance "
+                       f"'{cls.__module__}.{cls.__name__}'",
+                       extra={
+                           "class": {
+                               "name": cls.__name__,
+                               "module": cls.__module__
+                           },
+                           "config": config,
+                           "params": params
+                       })
 
         return instance
 
 
 class GenericCreator(BaseCreator):
+    __slots__ = ("class_key", "params_key")
+
     def __init__(self, class_key="class", params_key="params"):
         """
         A generic instance creator. With default values `class_key="class"` and
@@ -197,33 +272,37 @@ class GenericCreator(BaseCreator):
         Returns:
             object: Instance created from config.
         """
-        # extract dict containing class module and name
-        cls_config = config[self.class_key]
+        # bind the keys to locals once - this method is the innermost call
+        # of the recursive shorthand walk
+        class_key = self.class_key
+        params_key = self.params_key
 
-        # extract class name and module
-        name = cls_config["name"]
-        module = cls_config["module"]
-        module = importlib.import_module(module)
+        # extract class name and module in a single C-level call instead of
+        # two separate subscript operations
+        name, module = _get_name_module(config[class_key])
 
         # extract params
-        params = config.get(self.params_key)
-        if params is None:
-            params = {}
+        params = config.get(params_key)
 
         # get class
-        cls = getattr(module, name)
-        # create instance
-        instance = BaseCreator.unpack_and_create(cls, params)
-        _log.debug(f"GenericCreator created instance "
-                   f"'{cls.__module__}.{cls.__name__}'",
-                   extra={
-                       "class": {
-                           "name": cls.__name__,
-                           "module": cls.__module__
-                       },
-                       "config": config,
-                       "params": params
-                   })
+        cls = _resolve(module, name)
+        # create instance; no params at all means a plain no-argument call,
+        # skipping the dict allocation and unpacking machinery entirely
+        if params is None:
+            instance = cls()
+        else:
+            instance = BaseCreator.unpack_and_create(cls, params)
+        if __debug__ and _log.isEnabledFor(logging.DEBUG):
+            _log.debug(f"GenericCreator created instance "
+                       f"'{cls.__module__}.{cls.__name__}'",
+                       extra={
+                           "class": {
+                               "name": cls.__name__,
+                               "module": cls.__module__
+                           },
+                           "config": config,
+                           "params": params
+                       })
 
         return instance
 
@@ -293,39 +372,59 @@ class ShorthandCreator(GenericCreator):
     where instance_1_from_configuration and instance_2_from_configuration are
     separate instances of the same class.
     """
-    _builtin_types = {
-        t for t in builtins.__dict__.values() if isinstance(t, type)}
+    __slots__ = ("mutate",)
 
-    @staticmethod
-    def parse_dotted_key(key):
-        """
-        Parse "module.submodule.object" to 2-tuple
-        ("module.submodule", "object"). In case input string contains no dots,
-        raise an exception.
+    # kept as a staticmethod for API compatibility; the actual (cached)
+    # implementation lives at module level
+    parse_dotted_key = staticmethod(_parse_dotted_key)
 
+    def __init__(self, class_key="class", params_key="params", mutate=False):
+        """
         Args:
-            key (str): An input string to parse
-
-        Returns:
-            tuple: A 2-tuple containing information about `(module, object)`
-                parsed from the input string.
-
-        Raises:
-            ValueError: In case input contains no dots
+            class_key (str, optional): See GenericCreator. Defaults to
+                "class".
+            params_key (str, optional): See GenericCreator. Defaults to
+                "params".
+            mutate (bool, optional): When True, dictionaries in the config
+                are rewritten in place instead of copied, halving the
+                transient memory footprint for large configs. The caller
+                gives up the original config in exchange. Defaults to False.
         """
-        if '.' not in key:
-            raise ValueError(f"Input string *must* contain both module and an "
-                             f"object. String '{key}' does not.")
-
-        return key.rsplit('.', 1)
+        super().__init__(class_key=class_key, params_key=params_key)
+        self.mutate = mutate
 
     def _create_list(self, config, cache):
-        return [self.create(item, cache) for item in config]
+        # bind the bound method once instead of re-resolving it per item
+        create = self._create_cached
+        return [item if isinstance(item, _SCALAR_TYPES)
+                else create(item, cache)
+                for item in config]
 
     def _create_dict(self, config, cache):
-        return {k: self.create(v, cache) for k, v in config.items()}
-
-    def _create_instance(self, config, cache):
+        # bind the bound method once instead of re-resolving it per item
+        create = self._create_cached
+        if self.mutate:
+            # opt-in in-place rewrite: no second dict of the same size is
+            # allocated. Replacing values during items() iteration is safe
+            # since the dict never changes size
+            for k, v in config.items():
+                if not isinstance(v, _SCALAR_TYPES):
+                    config[k] = create(v, cache)
+            return config
+        if len(config) > 8:
+            # dict.fromkeys pre-sizes the output to its final size, so large
+            # configs skip the incremental resizes a comprehension goes
+            # through while it grows from empty
+            out = dict.fromkeys(config)
+            for k, v in config.items():
+                out[k] = (v if isinstance(v, _SCALAR_TYPES)
+                          else create(v, cache))
+            return out
+        return {k: (v if isinstance(v, _SCALAR_TYPES)
+                    else create(v, cache))
+                for k, v in config.items()}
+
+    def _create_instance(self, config, cache, key=None):
         """
         Convert
 
@@ -342,25 +441,31 @@ class ShorthandCreator(GenericCreator):
             config (dict): A config dictionary to use for extraction of class
                 name, module and params.
             cache (dict): Cache to use when creating instance recursively.
+            key (str, optional): The single dotted key of `config`, when the
+                caller already extracted it. Defaults to None.
 
         Returns:
             object: Instance created from config.
         """
-        # take first (and only) key, extract module and class
-        key = next(iter(config))
+        if key is None:
+            # take first (and only) key and its value in a single traversal
+            (key, raw_params), = config.items()
+        else:
+            raw_params = config[key]
         module, class_ = self.parse_dotted_key(key)
         # preorder instance creation: parse instance params before using them
         # to recursively instantiate objects without any configuration
-        params = self.create(config[key], cache)
-
-        # use GenericCreator.create to make an actual instance
-        return super().create({
-            "class": {
-                "name": class_,
-                "module": module
-            },
-            "params": params
-        })
+        params = self._create_cached(raw_params, cache)
+
+        # resolve the class and instantiate it directly instead of routing
+        # through GenericCreator.create with a synthetic config dict that
+        # would immediately be deconstructed again
+        cls = _resolve(module, class_)
+        # no params at all means a plain no-argument call, skipping the dict
+        # allocation and unpacking machinery entirely
+        if params is None:
+            return cls()
+        return BaseCreator.unpack_and_create(cls, params)
 
     def _create_anything(self, config, cache=None):
         """
@@ -378,20 +483,27 @@ class ShorthandCreator(GenericCreator):
         Returns:
             object: Object created from config.
         """
-        if isinstance(config, list):
-            return self._create_list(config, cache)
-        elif isinstance(config, dict):
+        # exact-type checks are pointer compares and cover the types YAML
+        # and JSON produce; subclasses fall back to isinstance below
+        t = type(config)
+        if t is dict or isinstance(config, dict):
             # only try to create an instance from dictionaries with a single
             # key
             if len(config) == 1:
-                key = next(iter(config))
-                # only create an instance from "dotted keys"
-                if '.' in key:
-                    return self._create_instance(config, cache)
+                # tuple-unpacking a known single-key dict skips the explicit
+                # iterator allocation of next(iter(config))
+                (key,) = config
+                # only create an instance from string "dotted keys"; reuse
+                # the extracted key so _create_instance does not walk the
+                # dict a second time
+                if isinstance(key, str) and '.' in key:
+                    return self._create_instance(config, cache, key)
 
             # if we are unable to create an instance from dict, assume it is a
             # dictionary
             return self._create_dict(config, cache)
+        elif t is list or isinstance(config, list):
+            return self._create_list(config, cache)
         # if everything else fails, return raw config
         return config
 
@@ -404,73 +516,138 @@ class ShorthandCreator(GenericCreator):
         original anchor dictionary. The consequence of this is that we can
         freely use object id to cache instances by.
 
+        Note. Using id() as a cache key is only safe because the cache never
+            outlives a single top-level create() call: the caller holds the
+            whole config tree alive for the duration of the walk, so CPython
+            cannot free a config node and recycle its id while an entry for
+            it is still in the cache. Do not store this cache across calls
+            without revisiting that assumption.
+
         Args:
             config (object): Any Python object.
 
         Returns:
             int: A hash used for differentiating different configs/objects.
         """
+        # note: _create_cached inlines this as a plain id() call; this method
+        # remains as the documented, overridable definition of the hash
         return id(config)
 
-    def _smart_cache(self, cache, hash_, instance, config):
+    def create(self, config, cache=None):
         """
-        There is no need to cache everything. Cache only non-builtin types.
+        Public entry point. Initialize the per-call cache when needed and
+        hand off to `_create_cached`, which assumes the cache already exists -
+        this keeps the `cache is None` branch out of every recursive call.
 
         Args:
+            config (dict): A config dictionary to use for extraction of class
+                name, module and params.
             cache (dict): Cache to use when creating instance recursively.
-            hash_ (int): A hash used for differentiating different
-                configs/objects.
-            instance (object): Actual instance to cache (or not).
-            config (dict): Config from which instance was created. Passed
-                merely for the purpose of more verbose logging.
 
         Returns:
-            dict: updated input cache. Returned for convenience only.
+            object: Object created from config.
         """
-        if type(instance) in self._builtin_types:
-            _log.debug(f"Ignore caching builtin type {type(instance)} from "
-                       f"hash '{hash_}'",
-                       extra={"config": config})
-            return cache
-
-        _log.debug(f"Saving {type(instance)} to cache with hash '{hash_}'",
-                   extra={"config": config})
-        cache[hash_] = instance
-        return cache
+        if cache is None:
+            cache = {}
+        return self._create_cached(config, cache)
 
-    def create(self, config, cache=None):
+    def _create_cached(self, config, cache):
         """
         Reuse cached instance if current config was already parsed, which is
         determined by a custom hash value. In case it wasn't parsed already,
-        parse it and possibly* add it to cache.
-
-        * see `ShorthandCreatorWithCache._smart_cache` for more details
+        parse it and add it to cache. There is no need to cache everything,
+        so only non-builtin types are cached - caching builtins would only
+        grow the cache without saving any work.
 
         Args:
             config (dict): A config dictionary to use for extraction of class
                 name, module and params.
             cache (dict): Cache to use when creating instance recursively.
+                Unlike `create`, the cache is required here.
 
         Returns:
             object: Object created from config.
         """
-        if cache is None:
-            cache = {}
-
-        hash_ = self._calc_config_hash(config)
-        if hash_ not in cache:
+        # scalar leaves can never produce an instance and are never cached,
+        # so return them before paying for hashing and cache probes
+        if isinstance(config, _SCALAR_TYPES):
+            return config
+
+        # inlined _calc_config_hash - one builtin call instead of a method
+        # call per node; see that method for why id() is safe here
+        hash_ = id(config)
+        # a single .get probe instead of `in` followed by `[...]`, which
+        # would hash the key twice on the (common) cache-hit path
+        instance = cache.get(hash_, _MISSING)
+        if instance is _MISSING:
+            # mark this node as in-flight before recursing so a config that
+            # (through YAML aliases) contains itself is detected instead of
+            # recursing until the interpreter stack blows
+            cache[hash_] = _PENDING
             instance = self._create_anything(config, cache)
-            _log.debug(f"Creating {type(instance)} from hash '{hash_}'",
-                       extra={"config": config})
-            cache = self._smart_cache(cache, hash_, instance, config)
-        else:
-            instance = cache[hash_]
+            if __debug__ and _log.isEnabledFor(logging.DEBUG):
+                _log.debug(f"Creating {type(instance)} from hash '{hash_}'",
+                           extra={"config": config})
+            if type(instance) not in _BUILTIN_TYPES:
+                cache[hash_] = instance
+            else:
+                # builtins are never cached - drop the in-flight marker
+                del cache[hash_]
+        elif instance is _PENDING:
+            raise ValueError("Config contains a reference cycle - a config "
+                             "node (YAML anchor) is aliased inside itself")
+        elif __debug__ and _log.isEnabledFor(logging.DEBUG):
             _log.debug(f"Using cached {type(instance)} from hash '{hash_}'",
                        extra={"config": config})
 
         return instance
 
+    def create_many(self, configs):
+        """
+        Create objects from multiple configs. All dotted keys are collected
+        up front and their objects resolved in a single batch, so the import
+        machinery is warmed once instead of lazily during each walk.
 
+        Args:
+            configs (Iterable): An iterable of configs, each in the format
+                accepted by `create`.
+
+        Returns:
+            list: A list of objects created from the provided configs.
+        """
+        configs = list(configs)
+
+        # collect every dotted string key appearing anywhere in the configs
+        keys = set()
+
+        def collect(config):
+            if isinstance(config, dict):
+                for key, value in config.items():
+                    if isinstance(key, str) and '.' in key:
+                        keys.add(key)
+                    collect(value)
+            elif isinstance(config, list):
+                for value in config:
+                    collect(value)
+
+        for config in configs:
+            collect(config)
+
+        # warm the resolver cache in one batch
+        for key in keys:
+            module, object_ = self.parse_dotted_key(key)
+            try:
+                _resolve(module, object_)
+            except (ImportError, AttributeError):
+                # not every dotted key refers to an importable object (e.g.
+                # keys of multi-key dicts never become instances) - leave
+                # raising actual errors to the walk itself
+                pass
+
+        return [self.create(config) for config in configs]
+
+
+@functools.lru_cache(maxsize=4096)
 def get_object(key):
     """
     A ShorthandCreator companion function used for getting any object from
@@ -499,5 +676,4 @@ def get_object(key):
         object: imported object
     """
     module_name, object_name = ShorthandCreator.parse_dotted_key(key)
-    module = importlib.import_module(module_name)
-    return getattr(module, object_name)
+    return _resolve(module_name, object_name)
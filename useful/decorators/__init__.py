@@ -1,4 +1,7 @@
+import asyncio
+import inspect
 import logging
+import random
 import time
 import threading
 from functools import wraps
@@ -47,14 +50,16 @@ def _get_logger_func(logger, log_level):
 
 def retry(retries=1, delay=0, exception=Exception, retry_callback=None,
           final_callback=None, retry_log_level=logging.WARNING,
-          retry_log_traceback=True):
+          retry_log_traceback=True, backoff_factor=1, max_delay=None,
+          max_total_time=None, jitter=0):
     """
     Decorator that retries given function multiple times with specified delay
     between re-runs.
 
     Args:
         retries (int): number of times to retry
-        delay (float): seconds to delay between re-runs
+        delay (float): seconds to delay between re-runs. With the default
+            `backoff_factor=1` the delay stays constant.
         exception (class): specify exception type to retry on. Defaults to
             Exception.
         retry_callback (function): function to call every time after wrapped
@@ -70,40 +75,167 @@ def retry(retries=1, delay=0, exception=Exception, retry_callback=None,
             be used.
         retry_log_traceback (bool): A flag indicating whether or not retry logs
             should contain exception traceback.
+        backoff_factor (float): multiply the delay by this factor after every
+            failed attempt (exponential backoff). Defaults to 1, keeping the
+            delay constant for backward compatibility.
+        max_delay (float): upper bound for the delay between attempts when
+            using backoff. Defaults to None, meaning no bound.
+        max_total_time (float): total time budget in seconds, measured from
+            the first attempt on a monotonic clock. When sleeping before the
+            next attempt would exceed the budget, the exception is raised
+            immediately instead of wasting the sleep. Defaults to None,
+            meaning no budget.
+        jitter (float): randomize each sleep within
+            `[delay * (1 - jitter), delay * (1 + jitter)]` so many clients
+            that failed together do not retry in lockstep against a
+            recovering backend. Expected total retry time is unchanged.
+            Defaults to 0, meaning no randomization.
+
+    Note:
+        When the decorated function is a coroutine function, an async wrapper
+        is returned which uses `asyncio.sleep` between attempts, so concurrent
+        retrying coroutines overlap their delays instead of blocking the event
+        loop. Callbacks returning awaitables are awaited.
     """
     assert delay >= 0
+    assert backoff_factor >= 1
+    assert max_delay is None or max_delay >= delay
+    assert 0 <= jitter <= 1
     if retries < 0:
         retries = float('+inf')
 
     retry_log_func = _get_logger_func(_log, retry_log_level)
 
+    # per-decoration RNG so concurrent wrapped functions do not contend on
+    # the shared random module state
+    _uniform = random.Random().uniform
+
+    def _sleep_time(current_delay):
+        """
+        Apply jitter to the delay before sleeping on it.
+        """
+        if not jitter:
+            return current_delay
+        return _uniform(current_delay * (1 - jitter),
+                        current_delay * (1 + jitter))
+
+    def _next_delay(current_delay):
+        """
+        Grow the delay by `backoff_factor`, bounded by `max_delay`. One
+        incremental multiplication per retry - no pow calls in the loop.
+        """
+        current_delay = current_delay * backoff_factor
+        if max_delay is not None and current_delay > max_delay:
+            return max_delay
+        return current_delay
+
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def function(*args, **kwargs):
+                call_count = 0
+                max_calls = 1 + retries
+                current_delay = delay
+                deadline = None if max_total_time is None \
+                    else time.monotonic() + max_total_time
+                while call_count < max_calls:
+                    try:
+                        call_count += 1
+                        return await func(*args, **kwargs)
+                    except exception as e:
+                        # %-style lazy args: the strings are only formatted
+                        # when a handler actually emits the record
+                        if call_count == max_calls:
+                            retry_log_func(
+                                "[%s / %s] Caught error '%s'. All retries "
+                                "failed. Not retrying anymore.",
+                                call_count, max_calls, e,
+                                exc_info=retry_log_traceback)
+
+                            if final_callback is not None:
+                                result = final_callback(e, *args, **kwargs)
+                                if inspect.isawaitable(result):
+                                    await result
+                            raise
+
+                        # sleeping past the deadline is pure waste - raise
+                        # right away instead
+                        if deadline is not None and \
+                                time.monotonic() + current_delay >= deadline:
+                            retry_log_func(
+                                "[%s / %s] Caught error '%s'. Time budget "
+                                "exhausted. Not retrying anymore.",
+                                call_count, max_calls, e,
+                                exc_info=retry_log_traceback)
+
+                            if final_callback is not None:
+                                result = final_callback(e, *args, **kwargs)
+                                if inspect.isawaitable(result):
+                                    await result
+                            raise
+                        retry_log_func(
+                           "[%s / %s] Caught error '%s'. Retrying in %s "
+                           "seconds",
+                           call_count, max_calls, e, current_delay,
+                           exc_info=retry_log_traceback)
+
+                        if retry_callback is not None:
+                            result = retry_callback(e, *args, **kwargs)
+                            if inspect.isawaitable(result):
+                                await result
+                        # asyncio.sleep yields to the event loop, so other
+                        # coroutines keep running during the delay
+                        await asyncio.sleep(_sleep_time(current_delay))
+                        current_delay = _next_delay(current_delay)
+            return function
+
         @wraps(func)
         def function(*args, **kwargs):
             call_count = 0
             max_calls = 1 + retries
+            current_delay = delay
+            deadline = None if max_total_time is None \
+                else time.monotonic() + max_total_time
             while call_count < max_calls:
                 try:
                     call_count += 1
                     return func(*args, **kwargs)
                 except exception as e:
-                    m = f"[{call_count} / {max_calls}] Caught error '{e}'."
-
+                    # %-style lazy args: the strings are only formatted when
+                    # a handler actually emits the record
                     if call_count == max_calls:
                         retry_log_func(
-                           f"{m} All retries failed. Not retrying anymore.",
+                           "[%s / %s] Caught error '%s'. All retries failed. "
+                           "Not retrying anymore.",
+                           call_count, max_calls, e,
+                           exc_info=retry_log_traceback)
+
+                        if final_callback is not None:
+                            final_callback(e, *args, **kwargs)
+                        raise
+
+                    # sleeping past the deadline is pure waste - raise right
+                    # away instead
+                    if deadline is not None and \
+                            time.monotonic() + current_delay >= deadline:
+                        retry_log_func(
+                           "[%s / %s] Caught error '%s'. Time budget "
+                           "exhausted. Not retrying anymore.",
+                           call_count, max_calls, e,
                            exc_info=retry_log_traceback)
 
                         if final_callback is not None:
                             final_callback(e, *args, **kwargs)
                         raise
                     retry_log_func(
-                       f"{m} Retrying in {delay} seconds",
+                       "[%s / %s] Caught error '%s'. Retrying in %s seconds",
+                       call_count, max_calls, e, current_delay,
                        exc_info=retry_log_traceback)
 
                     if retry_callback is not None:
                         retry_callback(e, *args, **kwargs)
-                    time.sleep(delay)
+                    time.sleep(_sleep_time(current_delay))
+                    current_delay = _next_delay(current_delay)
         return function
     return decorator
 
@@ -111,9 +243,15 @@ def retry(retries=1, delay=0, exception=Exception, retry_callback=None,
 def timing(f):
     @wraps(f)
     def wrap(*args, **kwargs):
-        start = time.time()
+        # the log line is this decorator's only output - when debug logging
+        # is disabled, skip the clock reads and f-string formatting entirely
+        if not _log.isEnabledFor(logging.DEBUG):
+            return f(*args, **kwargs)
+
+        # monotonic clock: immune to wall-clock jumps and cheaper to read
+        start = time.monotonic()
         result = f(*args, **kwargs)
-        end = time.time()
+        end = time.monotonic()
         delta = end - start
         _log.debug(f"Function call '{f.__name__}({args=}, {kwargs=})' took "
                    f"{delta:2.6f} sec")
@@ -128,12 +266,15 @@ def threaded_decorator(decorator):
 
         @wraps(f)
         def wrapper(*args, **kwargs):
-            try:
-                memory.f
-            except AttributeError:
-                memory.f = decorator(f)
+            # a single dict probe on the hot path instead of attribute
+            # access with AttributeError-driven initialization - raising and
+            # catching an exception per first call is far more expensive
+            # than this lookup on every call
+            cached = memory.__dict__.get('f')
+            if cached is None:
+                cached = memory.f = decorator(f)
 
-            return memory.f(*args, **kwargs)
+            return cached(*args, **kwargs)
 
         return wrapper
 
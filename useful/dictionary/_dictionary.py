@@ -11,7 +11,15 @@ def clean_dict(dictionary):
         dictionary (dict): A dictionary to clean.
 
     Returns:
-        dict: Cleaned input dictionary.
+        dict: Cleaned input dictionary. When there is nothing to filter out,
+            the input dictionary itself is returned, not a copy.
     """
-    _log.debug("Cleaning the dictionary")
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug("Cleaning the dictionary")
+
+    # the common case is a dictionary with no None values at all - a single
+    # C-speed scan avoids allocating a same-sized copy of the input
+    if not any(v is None for v in dictionary.values()):
+        return dictionary
+
     return {k: v for k, v in dictionary.items() if v is not None}
@@ -4,6 +4,9 @@ Convert multi-level dictionaries into mappings (single level dictionaries).
 
 DEFAULT_SEPARATOR = "."
 
+# sentinel for distinguishing "key missing" from stored None values
+_MISSING = object()
+
 
 def _concat_keys(keys, separator):
     """
@@ -17,11 +20,10 @@ def _concat_keys(keys, separator):
     Returns:
         str: Concatenated keys
     """
-    # convert key to strings in case some of the keys are numbers
-    keys = map(lambda x: str(x), keys)
-    # filter out empty strings
-    keys = filter(lambda x: len(x) > 0, keys)
-    return separator.join(keys)
+    # convert keys to strings (in case some of the keys are numbers) and
+    # filter out empty ones. A single generator expression instead of
+    # map/filter with per-call lambdas
+    return separator.join(s for s in (str(k) for k in keys) if s)
 
 
 def _dictionary_to_mapping(x, separator):
@@ -88,6 +90,51 @@ def _anything_to_mapping(x, separator):
     return {"": x}
 
 
+def _to_mapping_fast(x, separator, prefix, out):
+    """
+    Flatten `x` in a single pass by carrying the concatenated key prefix down
+    the walk and writing leaves straight into `out`. This avoids building an
+    intermediate mapping per node and re-concatenating its keys into the
+    parent on the way back up, which the generic `to_mapping` path does.
+
+    The walk is iterative with an explicit stack, so arbitrarily deep inputs
+    neither hit the interpreter recursion limit nor pay a Python frame per
+    node. Children are pushed in reverse so leaves land in `out` in the same
+    order the recursive formulation would produce.
+
+    Args:
+        x (object): Object to flatten
+        separator (str): Separator to use when concatenating keys
+        prefix (str): Concatenated keys of all the ancestors of `x`
+        out (dict): Output mapping leaves are written into
+    """
+    stack = [(x, prefix)]
+    while stack:
+        node, prefix = stack.pop()
+        if isinstance(node, dict):
+            children = []
+            for key, value in node.items():
+                key = str(key)
+                # empty key components are skipped, same as _concat_keys does
+                if not key:
+                    new_prefix = prefix
+                elif not prefix:
+                    new_prefix = key
+                else:
+                    new_prefix = f"{prefix}{separator}{key}"
+                children.append((value, new_prefix))
+            stack.extend(reversed(children))
+        elif isinstance(node, list):
+            children = []
+            for index, value in enumerate(node):
+                new_prefix = f"{prefix}{separator}{index}" if prefix \
+                    else str(index)
+                children.append((value, new_prefix))
+            stack.extend(reversed(children))
+        else:
+            out[prefix] = node
+
+
 def to_mapping(x, separator=DEFAULT_SEPARATOR, additional_functions=None):
     """
     Convert an object `x` to a mapping using `separator` when concatenating
@@ -108,118 +155,29 @@ def to_mapping(x, separator=DEFAULT_SEPARATOR, additional_functions=None):
     Returns:
         dict: A mapping containing all of the data from the input dictionary
     """
-    if additional_functions is None:
-        additional_functions = []
-
-    # build a list of functions to use when converting to mappings
-    functions = [
-        *additional_functions,
-        _dictionary_to_mapping,
-        _list_to_mapping,
-        _anything_to_mapping
-    ]
-
-    # find the first function that "knows" how to convert `x` to mapping
-    for function in functions:
+    if not additional_functions:
+        # without custom conversion functions the result is fully determined
+        # by the dict/list/leaf structure, so take the single-pass path that
+        # skips all of the intermediate per-node mappings
+        out = {}
+        _to_mapping_fast(x, separator, "", out)
+        return out
+
+    # find the first custom function that "knows" how to convert `x` to a
+    # mapping - these keep the AssertionError protocol
+    for function in additional_functions:
         try:
-            # since `_anything_to_mapping` does not raise AssertionError in the
-            # worst case it will get called and we will return that result.
             return function(x, separator)
         except AssertionError:
             pass
 
-
-def _create_dict(*keys, value=None):
-    """
-    From `keys = [key_1, key_2, ..., key_n]` and `value = value` generate a
-    dictionary
-
-                        ```
-                        {
-                            key_1: {
-                                key_2: {
-                                    ...: {
-                                        key_n: value
-                                    }
-                                }
-                            }
-                        }
-                        ```
-
-    Args:
-        *keys (list): A list of keys to use for creating a dict
-        value (object, optional): A value to use when creating a dict. Defaults
-            to None.
-
-    Returns:
-        dict: A dictionary constructed from provided keys and value.
-    """
-    if len(keys) == 0:
-        return value
-
-    return {keys[0]: _create_dict(*keys[1:], value=value)}
-
-
-def _merge_dicts(x, y):
-    """
-    Merge dictionary `y` into dictionary `x` recursively. When merging dicts
-
-                            ```
-                            x = {
-                                "first": {
-                                    "second": 2
-                                }
-                            }
-                            ```
-
-    and
-
-                            ```
-                            y = {
-                                "first": {
-                                    "third": 3
-                                }
-                            }
-                            ```
-
-    by calling `_merge_dicts(x, y)`, we expect the result
-
-                            ```
-                            {
-                                "first": {
-                                    "second": 2,
-                                    "third": 3
-                                }
-                            }
-                            ```
-
-    instead of the usual result by merging only over first-level keys.
-
-    Args:
-        x (dict): A dictionary to merge into
-        y (dict): A dictionary to merge from
-
-    Returns:
-        dict: Merged dictionary
-    """
-    # trivial case when x is None
-    if x is None:
-        return y
-
-    # trivial case when y is None
-    if y is None:
-        return x
-
-    # when neither x nor y are None, we expect dictionaries
-    assert isinstance(x, dict)
-    assert isinstance(y, dict)
-
-    new = x.copy()
-    # iterate through y and merge every key, value pair into x
-    for key, value in y.items():
-        new[key] = _merge_dicts(new.get(key), value)
-
-    return new
+    # the built-in conversions dispatch explicitly instead of raising and
+    # catching AssertionError per candidate
+    if isinstance(x, dict):
+        return _dictionary_to_mapping(x, separator)
+    if isinstance(x, list):
+        return _list_to_mapping(x, separator)
+    return _anything_to_mapping(x, separator)
 
 
 def _convert_to_list(x):
@@ -255,17 +213,19 @@ def _convert_to_list(x):
     for k, v in x.items():
         y[k] = _convert_to_list(v)
 
-    # try to convert newly created dict y into list
-    try:
-        lst = []
-        for index in range(len(y)):
-            # if str(index) is not a key in y, KeyError is raised which means
-            # we cannot convert this dictionary into a list
-            lst.append(y[str(index)])
-        return lst
-    except KeyError:
-        # return "unconverted" y with converted values only
-        return y
+    # try to convert newly created dict y into list. Probing with get and a
+    # sentinel bails out on the first missing index without the cost of
+    # raising and catching a KeyError
+    lst = []
+    for index in range(len(y)):
+        value = y.get(str(index), _MISSING)
+        if value is _MISSING:
+            # str(index) is not a key in y, which means we cannot convert
+            # this dictionary into a list - return "unconverted" y with
+            # converted values only
+            return y
+        lst.append(value)
+    return lst
 
 
 def from_mapping(mapping, separator=DEFAULT_SEPARATOR):
@@ -286,10 +246,15 @@ def from_mapping(mapping, separator=DEFAULT_SEPARATOR):
     for key, value in mapping.items():
         # parse key using separator
         keys = key.split(separator)
-        # create a dictionary from keys list and value
-        tmp = _create_dict(*keys, value=value)
-        # merge newly created dictionary into x
-        x = _merge_dicts(x, tmp)
+        # walk (and create as needed) the nested dicts leading to the leaf -
+        # a single in-place pass per entry, with no dictionary copying
+        node = x
+        for part in keys[:-1]:
+            node = node.setdefault(part, {})
+            # a non-dict on the path means two keys conflict, e.g. "a" and
+            # "a.b" both carrying values
+            assert isinstance(node, dict)
+        node[keys[-1]] = value
 
     # if possible, (recursively) convert x to a list
     x = _convert_to_list(x)
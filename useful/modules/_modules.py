@@ -1,3 +1,4 @@
+import functools
 import importlib.util
 import inspect
 import logging
@@ -30,18 +31,27 @@ def import_modules(*modules, raise_on_fail=True):
     try:
         for module in modules:
             name = module.split(".", 1)[0]
-            module_ = __import__(module, globals(), locals())
-            setattr(_this, name, module_)
-            _log.debug(f"Importing '{module}' into '{_name}'")
+            # import_module is the supported fast path and caches in
+            # sys.modules; legacy __import__ with globals/locals is slower
+            importlib.import_module(module)
+            # regular `import a.b` binds the top-level package name, so do
+            # the same here
+            setattr(_this, name, sys.modules[name])
+            _log.debug("Importing '%s' into '%s'", module, _name)
     except ImportError:
         if raise_on_fail:
             raise
-        _log.debug(f"Failed to import '{module}' into '{_name}'")
+        _log.debug("Failed to import '%s' into '%s'", module, _name)
 
 
+@functools.lru_cache(maxsize=None)
 def installed(*modules):
     """
     Check if all modules from the list are installed by importing them.
+    Results are cached per modules tuple - find_spec scans sys.path, which
+    is wasted work when the same dependency check runs repeatedly (e.g.
+    through `Depend.installed`). Call `installed.cache_clear()` if packages
+    get installed at runtime.
 
     Args:
         modules ([str]): A list of strings each representing a module
@@ -58,17 +68,17 @@ def installed(*modules):
             found = None
 
         if found is None:
-            _log.debug(f"Failed to find module '{module}'")
+            _log.debug("Failed to find module '%s'", module)
             failed.append(module)
         else:
-            _log.debug(f"Successfully found module '{module}'")
+            _log.debug("Successfully found module '%s'", module)
 
     total = len(modules)
     successful = total - len(failed)
     everything_installed = len(failed) == 0
 
-    _log.debug(f"Successfully found {successful}/{total} modules. Returning "
-               f"{everything_installed}")
+    _log.debug("Successfully found %d/%d modules. Returning %s",
+               successful, total, everything_installed)
     return everything_installed
 
 
@@ -91,7 +101,7 @@ def depend(*modules, raise_on_fail=True):
     """
     import_modules(*modules, raise_on_fail=raise_on_fail)
 
-    def f():
-        return installed(*modules)
+    # partial skips the extra Python-level frame a wrapper function would add
+    f = functools.partial(installed, *modules)
 
     return Depend(modules=modules, installed=f)
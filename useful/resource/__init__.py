@@ -1,3 +1,3 @@
 from useful.resource import downloaders, parsers  # noqa
 from useful.resource.downloaders import open_  # noqa
-from useful.resource._load import load  # noqa
+from useful.resource._load import load, aload, cached_load  # noqa
@@ -2,6 +2,7 @@ from useful.resource.downloaders._downloaders import add_downloader  # noqa
 from useful.resource.downloaders._downloaders import downloaders  # noqa
 from useful.resource.downloaders._downloaders import get_downloader  # noqa
 from useful.resource.downloaders._downloaders import open_  # noqa
+from useful.resource.downloaders._downloaders import open_many  # noqa
 from useful.resource.downloaders._downloaders import remove_downloader  # noqa
 
 from useful.modules import installed
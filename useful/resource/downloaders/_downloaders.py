@@ -1,29 +1,33 @@
+import collections
+import concurrent.futures
+import functools
 import logging
+import os
+import threading
 
 from useful.resource.util import maybe_urlparse
 
 _log = logging.getLogger(__name__)
 
+# cache of is_binary results keyed by the file's stat fingerprint - a file
+# whose (device, inode, mtime, size) have not changed cannot have flipped
+# between text and binary, so repeated local_storage opens of the same file
+# skip the 8 KiB sniff read entirely
+_binary_cache = collections.OrderedDict()
+_binary_cache_lock = threading.Lock()
+_BINARY_CACHE_MAXSIZE = 256
+
 
 def is_binary(path):
     """
-    Check whether existing local path is binary.
+    Check whether existing local path is binary. Only the first 8 KiB are
+    inspected for a null byte - the same heuristic grep-like tools use -
+    so the answer costs a single small read regardless of file size.
     """
-    _log.debug(f"Checking if file '{path}' is binary")
-
-    fin = open(path, 'rb')
-    try:
-        CHUNKSIZE = 1024
-        while 1:
-            chunk = fin.read(CHUNKSIZE)
-            if b'\0' in chunk:  # found null byte
-                return True
-            if len(chunk) < CHUNKSIZE:
-                break
-    finally:
-        fin.close()
+    _log.debug("Checking if file '%s' is binary", path)
 
-    return False
+    with open(path, 'rb') as fin:
+        return b'\0' in fin.read(8192)
 
 
 def local_storage(url, *args, **kwargs):
@@ -32,7 +36,21 @@ def local_storage(url, *args, **kwargs):
     """
     parsed = maybe_urlparse(url)
     path = f"{parsed.netloc}{parsed.path}"
-    mode = "rb" if is_binary(path) else "r"
+
+    st = os.stat(path)
+    key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+    with _binary_cache_lock:
+        binary = _binary_cache.get(key)
+        if binary is not None:
+            _binary_cache.move_to_end(key)
+    if binary is None:
+        binary = is_binary(path)
+        with _binary_cache_lock:
+            _binary_cache[key] = binary
+            if len(_binary_cache) > _BINARY_CACHE_MAXSIZE:
+                _binary_cache.popitem(last=False)
+
+    mode = "rb" if binary else "r"
     return open(path, mode, *args, **kwargs)
 
 
@@ -53,6 +71,7 @@ def add_downloader(scheme, downloader):
             scheme
     """
     downloaders[scheme] = downloader
+    _resolve.cache_clear()
 
 
 def remove_downloader(scheme):
@@ -62,7 +81,9 @@ def remove_downloader(scheme):
     Args:
         scheme (str): Remove downloader function for this scheme
     """
-    return downloaders.pop(scheme, None)
+    removed = downloaders.pop(scheme, None)
+    _resolve.cache_clear()
+    return removed
 
 
 def get_downloader(url, scheme=None):
@@ -90,6 +111,17 @@ def get_downloader(url, scheme=None):
     return downloader
 
 
+@functools.lru_cache(maxsize=2048)
+def _resolve(url):
+    """
+    Cached (parsed url, downloader) pair for a string url - repeat opens of
+    the same url skip both the parse and the scheme dispatch. Invalidated
+    whenever the downloaders registry changes.
+    """
+    parsed = maybe_urlparse(url)
+    return parsed, get_downloader(parsed)
+
+
 def open_(url, *args, **kwargs):
     """
     A "smart" function similar to Python's built-in open function. The logic is
@@ -107,6 +139,39 @@ def open_(url, *args, **kwargs):
     Returns:
         file: A file-like object containing bytes from resource at provided url
     """
-    parsed = maybe_urlparse(url)
-    downloader = get_downloader(parsed)
+    if isinstance(url, str):
+        parsed, downloader = _resolve(url)
+    else:
+        parsed = maybe_urlparse(url)
+        downloader = get_downloader(parsed)
     return downloader(url=parsed, *args, **kwargs)
+
+
+def open_many(urls, max_workers=16, *args, **kwargs):
+    """
+    Download multiple resources in parallel. Every downloader is I/O bound,
+    so running open_ across a thread pool overlaps the network round trips
+    - the shared per-scheme clients and sessions make the extra threads
+    cheap.
+
+    Args:
+        urls (iterable): Locations of the resources we want to download
+        max_workers (int, optional): Maximum number of parallel downloads.
+            Defaults to 16.
+        args (tuple): Args to pass to each downloader function
+        kwargs (dict): Kwargs to pass to each downloader function
+
+    Returns:
+        dict: A {url: file-like object} mapping, in input order
+    """
+    urls = list(urls)
+    if not urls:
+        return {}
+
+    max_workers = min(max_workers, len(urls))
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = {
+            url: executor.submit(open_, url, *args, **kwargs)
+            for url in urls
+        }
+        return {url: future.result() for url, future in futures.items()}
@@ -1,23 +1,36 @@
 import logging
 import threading
 from io import BytesIO
-from functools import lru_cache
 
 from google.cloud import storage
 
 from useful.resource.util import maybe_urlparse
 from useful.resource.downloaders._downloaders import add_downloader
-from useful.decorators import threaded_decorator
 
 _log = logging.getLogger(__name__)
-threaded_lru_cache = threaded_decorator(lru_cache(maxsize=1024))
+
+# google-cloud-storage clients are thread-safe, so a single client per unique
+# argument set is shared process-wide - N worker threads reuse one connection
+# pool instead of each paying for its own TLS handshakes
+_clients = {}
+_clients_lock = threading.Lock()
 
 
-@threaded_lru_cache
 def get_gs_client(*args, **kwargs):
-    _log.debug("Initializing google-cloud-storage client for thread: ",
-               f"{threading.current_thread().ident}")
-    return storage.Client(*args, **kwargs)
+    """
+    Get the shared google-cloud-storage client for the provided arguments,
+    creating it on first use (double-checked locking).
+    """
+    key = (args, tuple(sorted(kwargs.items())))
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                _log.debug("Initializing google-cloud-storage client")
+                client = storage.Client(*args, **kwargs)
+                _clients[key] = client
+    return client
 
 
 def google_storage(url, *args, **kwargs):
@@ -28,17 +41,22 @@ def google_storage(url, *args, **kwargs):
     parsed = maybe_urlparse(url)
     bucket_name = parsed.netloc
     path = parsed.path.lstrip("/")
-    _log.debug(f"Parsing url '{url}' into '{bucket_name=}' and '{path=}'")
+    _log.debug("Parsing url '%s' into '%s' and '%s'",
+               url, bucket_name, path)
 
-    _log.debug("Initializing Google Cloud Storage client")
     storage_client = get_gs_client(*args, **kwargs)
     bucket = storage_client.bucket(bucket_name)
 
-    _log.debug(f"Downloading the object '{bucket_name}/{path}' into file-like"
-               f" object")
+    _log.debug("Downloading the object '%s/%s' into file-like object",
+               bucket_name, path)
     blob = bucket.blob(path)
-    buffer = BytesIO(blob.download_as_bytes())
+    # stream directly into the buffer - download_as_bytes would materialize
+    # the whole payload as an intermediate bytes object first, which the
+    # BytesIO constructor then copies a second time
+    buffer = BytesIO()
+    blob.download_to_file(buffer)
 
+    buffer.seek(0)
     return buffer
 
 
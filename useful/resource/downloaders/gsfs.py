@@ -1,22 +1,33 @@
 import logging
 import threading
-from functools import lru_cache
 
 import gcsfs
 
 from useful.resource.util import maybe_urlparse
 from useful.resource.downloaders._downloaders import add_downloader
-from useful.decorators import threaded_decorator
 
 _log = logging.getLogger(__name__)
-threaded_lru_cache = threaded_decorator(lru_cache(maxsize=1024))
+
+# GCSFileSystem handles concurrent use, so a single instance is shared
+# process-wide instead of one per thread
+_fs = None
+_fs_lock = threading.Lock()
 
 
-@threaded_lru_cache
 def get_gsfs_client():
-    _log.debug("Initializing GCSFileSystem for thread: "
-               f"{threading.current_thread().ident}")
-    return gcsfs.GCSFileSystem()
+    """
+    Get the shared GCSFileSystem instance, creating it on first use
+    (double-checked locking).
+    """
+    global _fs
+    fs = _fs
+    if fs is None:
+        with _fs_lock:
+            fs = _fs
+            if fs is None:
+                _log.debug("Initializing GCSFileSystem")
+                fs = _fs = gcsfs.GCSFileSystem()
+    return fs
 
 
 def google_storage_fs(url, *args, **kwargs):
@@ -27,13 +38,13 @@ def google_storage_fs(url, *args, **kwargs):
     parsed = maybe_urlparse(url)
     bucket_name = parsed.netloc
     path = parsed.path.lstrip("/")
-    _log.debug(f"Parsing url '{url}' into '{bucket_name=}' and '{path=}'")
+    _log.debug("Parsing url '%s' into '%s' and '%s'",
+               url, bucket_name, path)
 
-    _log.debug("Initializing GCSFileSystem client")
     fs = get_gsfs_client()
 
-    _log.debug(f"Opening the object '{bucket_name}/{path}' for on-demand"
-               f" download")
+    _log.debug("Opening the object '%s/%s' for on-demand download",
+               bucket_name, path)
     return fs.open(f"{bucket_name}/{path}", *args, **kwargs)
 
 
@@ -1,22 +1,42 @@
 import logging
 import requests
+import shutil
 import threading
 from io import BytesIO
-from functools import lru_cache
+
+from requests.adapters import HTTPAdapter
 
 from useful.resource.downloaders._downloaders import add_downloader
 from useful.resource.util import maybe_urlunparse
-from useful.decorators import threaded_decorator
 
 _log = logging.getLogger(__name__)
-threaded_lru_cache = threaded_decorator(lru_cache(maxsize=1024))
+
+# requests.Session is thread-safe for requests, so a single session with a
+# generous connection pool is shared process-wide - repeat downloads to the
+# same host reuse live TCP/TLS connections across all threads
+_session = None
+_session_lock = threading.Lock()
 
 
-@threaded_lru_cache
 def get_session():
-    _log.debug(f"Initializing HTTP requests.Session for thread: "
-               f"{threading.current_thread().ident}")
-    return requests.Session()
+    """
+    Get the shared requests.Session, creating it on first use (double-checked
+    locking). The mounted adapters size the connection pool for many-threaded
+    use.
+    """
+    global _session
+    session = _session
+    if session is None:
+        with _session_lock:
+            session = _session
+            if session is None:
+                _log.debug("Initializing HTTP requests.Session")
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=128)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return session
 
 
 def http(url, *args, **kwargs):
@@ -27,9 +47,19 @@ def http(url, *args, **kwargs):
     raw_url = maybe_urlunparse(url)
 
     session = get_session()
-    _log.debug(f"Sending HTTP request: GET {raw_url}")
-    response = session.get(raw_url, *args, **kwargs)
-    return BytesIO(response.content)
+    _log.debug("Sending HTTP request: GET %s", raw_url)
+    # stream the body straight into the output buffer. Without stream=True,
+    # requests first accumulates the whole payload internally and then joins
+    # it into .content, doubling peak memory for large downloads
+    with session.get(raw_url, stream=True, *args, **kwargs) as response:
+        response.raise_for_status()
+        # decode gzip/deflate transparently, matching .content semantics
+        response.raw.decode_content = True
+        buffer = BytesIO()
+        shutil.copyfileobj(response.raw, buffer, length=65536)
+
+    buffer.seek(0)
+    return buffer
 
 
 # register downloader for http:// schema
@@ -2,23 +2,36 @@ import logging
 import os
 import threading
 from io import BytesIO
-from functools import lru_cache
 
 import boto3
 
 from useful.resource.util import maybe_urlparse
 from useful.resource.downloaders._downloaders import add_downloader
-from useful.decorators import threaded_decorator
 
 _log = logging.getLogger(__name__)
-threaded_lru_cache = threaded_decorator(lru_cache(maxsize=1024))
 
+# boto3 low-level clients are thread-safe (resources are not), so a single
+# client per unique argument set is shared process-wide - N worker threads
+# reuse one connection pool instead of each paying for its own handshakes
+_clients = {}
+_clients_lock = threading.Lock()
 
-@threaded_lru_cache
-def get_s3_resource(*args, **kwargs):
-    _log.debug("Initializing boto.resource for thread: "
-               f"{threading.current_thread().ident}")
-    return boto3.resource('s3', *args, **kwargs)
+
+def get_s3_client(*args, **kwargs):
+    """
+    Get the shared boto3 s3 client for the provided arguments, creating it on
+    first use (double-checked locking).
+    """
+    key = (args, tuple(sorted(kwargs.items())))
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                _log.debug("Initializing boto3 s3 client")
+                client = boto3.client('s3', *args, **kwargs)
+                _clients[key] = client
+    return client
 
 
 def s3(url, *args, **kwargs):
@@ -29,7 +42,8 @@ def s3(url, *args, **kwargs):
     parsed = maybe_urlparse(url)
     bucket_name = parsed.netloc
     path = parsed.path.lstrip("/")
-    _log.debug(f"Parsing url '{url}' into '{bucket_name=}' and '{path=}'")
+    _log.debug("Parsing url '%s' into '%s' and '%s'",
+               url, bucket_name, path)
 
     # allow the s3 endpoint to be changed through env variable. This makes it
     # possible to use self-hosted S3 alternatives
@@ -40,14 +54,12 @@ def s3(url, *args, **kwargs):
 
     final_kwargs.update(kwargs)
 
-    _log.debug("Initializing boto3 s3 resource")
-    s3 = get_s3_resource(*args, **final_kwargs)
-    bucket = s3.Bucket(bucket_name)
+    client = get_s3_client(*args, **final_kwargs)
 
-    _log.debug(f"Downloading the object '{bucket_name}/{path}' into file-like"
-               f" object")
+    _log.debug("Downloading the object '%s/%s' into file-like object",
+               bucket_name, path)
     buffer = BytesIO()
-    bucket.download_fileobj(path, buffer)
+    client.download_fileobj(bucket_name, path, buffer)
 
     buffer.seek(0)
     return buffer
@@ -1,23 +1,35 @@
 import logging
 import os
 import threading
-from functools import lru_cache
 
 import s3fs
 
 from useful.resource.util import maybe_urlparse
 from useful.resource.downloaders._downloaders import add_downloader
-from useful.decorators import threaded_decorator
 
 _log = logging.getLogger(__name__)
-threaded_lru_cache = threaded_decorator(lru_cache(maxsize=1024))
+
+# S3FileSystem handles concurrent use, so a single instance per unique
+# argument set is shared process-wide instead of one per thread
+_filesystems = {}
+_filesystems_lock = threading.Lock()
 
 
-@threaded_lru_cache
 def get_s3fs_filesystem(anon=False, **client_kwargs):
-    _log.debug("Initializing s3fs.S3FileSystem for thread: "
-               f"{threading.current_thread().ident}")
-    return s3fs.S3FileSystem(anon=anon, client_kwargs=client_kwargs)
+    """
+    Get the shared s3fs.S3FileSystem for the provided arguments, creating it
+    on first use (double-checked locking).
+    """
+    key = (anon, tuple(sorted(client_kwargs.items())))
+    fs = _filesystems.get(key)
+    if fs is None:
+        with _filesystems_lock:
+            fs = _filesystems.get(key)
+            if fs is None:
+                _log.debug("Initializing s3fs.S3FileSystem")
+                fs = s3fs.S3FileSystem(anon=anon, client_kwargs=client_kwargs)
+                _filesystems[key] = fs
+    return fs
 
 
 def _s3fs(url, *args, **kwargs):
@@ -28,7 +40,8 @@ def _s3fs(url, *args, **kwargs):
     parsed = maybe_urlparse(url)
     bucket_name = parsed.netloc
     path = parsed.path.lstrip("/")
-    _log.debug(f"Parsing url '{url}' into '{bucket_name=}' and '{path=}'")
+    _log.debug("Parsing url '%s' into '%s' and '%s'",
+               url, bucket_name, path)
 
     # allow the s3 endpoint to be changed through env variable. This makes it
     # possible to use self-hosted S3 alternatives
@@ -37,11 +50,10 @@ def _s3fs(url, *args, **kwargs):
     if endpoint_url is not None:
         client_kwargs["endpoint_url"] = endpoint_url
 
-    _log.debug("Initializing s3fs.S3FileSystem client")
     fs = get_s3fs_filesystem(anon=False, **client_kwargs)
 
-    _log.debug(f"Opening the object '{bucket_name}/{path}' for on-demand"
-               f" download")
+    _log.debug("Opening the object '%s/%s' for on-demand download",
+               bucket_name, path)
     return fs.open(f"{bucket_name}/{path}", *args, **kwargs)
 
 
@@ -1,29 +1,59 @@
 import logging
 import threading
 from io import BytesIO
-from functools import lru_cache
 
 import paramiko
 
 from useful.resource.util import maybe_urlparse
 from useful.resource.downloaders._downloaders import add_downloader
-from useful.decorators import threaded_decorator
 
 _log = logging.getLogger(__name__)
-threaded_lru_cache = threaded_decorator(lru_cache(maxsize=1024))
 
+# pool of authenticated connections keyed by (hostname, port, username).
+# An SSH connect costs a TCP handshake, a key exchange and user auth -
+# often hundreds of milliseconds - so subsequent downloads from the same
+# host reuse the live transport instead of paying that again. Each entry
+# carries its own lock because paramiko SFTP channels must not be used
+# from multiple threads at once
+_connections = {}
+_connections_lock = threading.Lock()
 
-@threaded_lru_cache
-def get_paramiko_sshclient():
-    _log.debug("Initializing paramiko.SSHClient for thread: "
-               f"{threading.current_thread().ident}")
-    ssh_client = paramiko.SSHClient()
-    _log.debug("Setting missing host key policy - auto add")
-    ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-    _log.debug("Loading system SSH keys")
-    ssh_client.load_system_host_keys()
 
-    return ssh_client
+def _get_sftp_client(hostname, port, username, password, *args, **kwargs):
+    """
+    Get a pooled, authenticated paramiko SFTP client for the provided host,
+    creating it on first use. A pooled connection whose transport has gone
+    down is discarded and replaced transparently.
+
+    Returns:
+        tuple: (paramiko.SFTPClient, threading.Lock) - hold the lock while
+            using the client
+    """
+    key = (hostname, port, username)
+    with _connections_lock:
+        entry = _connections.get(key)
+        if entry is not None:
+            ssh_client, sftp, lock = entry
+            transport = ssh_client.get_transport()
+            if transport is not None and transport.is_active():
+                return sftp, lock
+            _log.debug("Pooled SSH connection to %s:%s is dead, reconnecting",
+                       hostname, port)
+            ssh_client.close()
+            del _connections[key]
+
+        _log.debug("Opening SSH connection to %s@%s:%s",
+                   username, hostname, port)
+        ssh_client = paramiko.SSHClient()
+        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        ssh_client.load_system_host_keys()
+        ssh_client.connect(hostname, port=port, username=username,
+                           password=password, *args, **kwargs)
+        _log.debug("Opening an SFTP connection")
+        sftp = ssh_client.open_sftp()
+        lock = threading.Lock()
+        _connections[key] = (ssh_client, sftp, lock)
+        return sftp, lock
 
 
 def ssh(url, *args, **kwargs):
@@ -34,27 +64,15 @@ def ssh(url, *args, **kwargs):
     parsed = maybe_urlparse(url)
     port = parsed.port or 22
 
-    _log.debug("Initializing paramiko.SSHClient client")
-    ssh_client = get_paramiko_sshclient()
-
-    _log.debug(f"Opening SSH connection to "
-               f"{parsed.username}@{parsed.hostname}:{port}")
-    ssh_client.connect(parsed.hostname, port=port,
-                       username=parsed.username, password=parsed.password,
-                       *args, **kwargs)
-    _log.debug("Opening an SFTP connection")
-    sftp = ssh_client.open_sftp()
+    sftp, lock = _get_sftp_client(parsed.hostname, port, parsed.username,
+                                  parsed.password, *args, **kwargs)
 
-    _log.debug(f"Downloading file '{parsed.path}' into file-like object")
+    _log.debug("Downloading file '%s' into file-like object", parsed.path)
     buffer = BytesIO()
-    sftp.getfo(parsed.path, buffer)
+    with lock:
+        sftp.getfo(parsed.path, buffer)
     buffer.seek(0)
 
-    _log.debug("Closing SFTP connection")
-    sftp.close()
-    _log.debug("Closing SSH connection")
-    ssh_client.close()
-
     return buffer
 
 
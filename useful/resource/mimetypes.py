@@ -7,8 +7,8 @@ versions 3.7 and higher. The bug was introduced while solving another bug
                     https://bugs.python.org/issue4963
 """
 
+import functools
 import logging
-import os.path
 
 from useful.resource.util import maybe_urlparse
 
@@ -33,8 +33,10 @@ def add_type(type, ext, strict=True):
                f"{type.lower()}")
     global types_map
     types_map[ext.lower()] = type.lower()
+    guess_type.cache_clear()
 
 
+@functools.lru_cache(maxsize=1024)
 def guess_type(url, strict=True):
     """
     Arguments url and strict are named in a way to be compatible with standard
@@ -43,10 +45,21 @@ def guess_type(url, strict=True):
 
     The only difference is that mimetypes.guess_type() only accepts url as a
     string and we also support the urllib.parse.ParseResult.
+
+    Results are memoized - the cache is cleared whenever the extension
+    registry changes through add_type, remove_ext or remove_type.
     """
     parsed = maybe_urlparse(url)
     path = parsed.path
-    ext = os.path.splitext(path)[1].lower()
+    # inlined os.path.splitext - two rfinds and a slice instead of the
+    # generic implementation. Like splitext, dots in directories and the
+    # leading dots of a hidden file do not start an extension
+    slash = path.rfind('/')
+    i = path.rfind('.')
+    if i > slash and path[slash + 1:i].strip('.'):
+        ext = path[i:].lower()
+    else:
+        ext = ''
 
     if ext in types_map:
         _log.debug(f"Known type for '{url}': ({types_map[ext], None})")
@@ -64,7 +77,9 @@ def remove_ext(ext):
         ext (str): Extension to be removed.
     """
     _log.debug(f"Removing extension: {ext.lower()}")
-    return types_map.pop(ext.lower(), None)
+    removed = types_map.pop(ext.lower(), None)
+    guess_type.cache_clear()
+    return removed
 
 
 def remove_type(type):
@@ -6,10 +6,13 @@ from useful.resource.parsers._parsers import parsers  # noqa
 from useful.modules import installed
 
 # add optional parsers if dependencies are installed
-if installed("ruamel.yaml"):
+if installed("ruamel.yaml") or installed("yaml"):
     from useful.resource.parsers import yaml  # noqa
 
 if installed("numpy"):
     from useful.resource.parsers import numpy  # noqa
 
+if installed("orjson"):
+    from useful.resource.parsers import orjson  # noqa
+
 del installed
@@ -1,5 +1,16 @@
-import numpy as np
-
 from useful.resource.parsers._parsers import add_parser
 
-add_parser("application/numpy", np.load, ".npy", ".npz")
+
+def _numpy_load(f, *args, **kwargs):
+    """
+    Import numpy on first use. Importing it eagerly would make every
+    `import useful.resource` pay numpy's full import cost even when no
+    .npy/.npz file is ever read, so the registry starts with this thunk
+    and replaces itself with np.load on the first parse.
+    """
+    import numpy as np
+    add_parser("application/numpy", np.load)
+    return np.load(f, *args, **kwargs)
+
+
+add_parser("application/numpy", _numpy_load, ".npy", ".npz")
@@ -0,0 +1,19 @@
+import orjson
+
+from useful.resource.parsers._parsers import add_parser
+
+
+def _orjson_load(f, *args, **kwargs):
+    """
+    Parse JSON from a file-like object with orjson. Reading the whole
+    buffer and handing it to orjson's native parser is considerably faster
+    than json.load, which decodes incrementally in Python.
+    """
+    data = f.read()
+    if isinstance(data, str):
+        data = data.encode()
+    return orjson.loads(data)
+
+
+# replace the standard library parser registered for .json files
+add_parser("application/json", _orjson_load, ".json")
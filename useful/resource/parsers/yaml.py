@@ -1,5 +1,40 @@
-import ruamel.yaml
-
 from useful.resource.parsers._parsers import add_parser
 
-add_parser("application/yaml", ruamel.yaml.safe_load, ".yml", ".yaml")
+
+def _select_yaml_parser():
+    """
+    Pick the fastest available YAML parser. PyYAML's CSafeLoader wraps the
+    libyaml C library and is typically an order of magnitude faster than
+    the pure-Python loaders, so it is preferred when present; otherwise
+    fall back to ruamel.yaml and finally to pure-Python PyYAML.
+    """
+    try:
+        from yaml import CSafeLoader, load
+
+        def parser(f, *args, **kwargs):
+            return load(f, CSafeLoader)
+        return parser
+    except ImportError:
+        pass
+
+    try:
+        import ruamel.yaml
+        return ruamel.yaml.safe_load
+    except ImportError:
+        from yaml import safe_load
+        return safe_load
+
+
+def _yaml_safe_load(f, *args, **kwargs):
+    """
+    Select and import a YAML parser on first use. Importing one eagerly
+    would make every `import useful.resource` pay for a heavy YAML import
+    even when no YAML is ever parsed, so the registry starts with this
+    thunk and replaces itself with the selected parser on the first parse.
+    """
+    parser = _select_yaml_parser()
+    add_parser("application/yaml", parser)
+    return parser(f, *args, **kwargs)
+
+
+add_parser("application/yaml", _yaml_safe_load, ".yml", ".yaml")
@@ -1,6 +1,24 @@
+import functools
 from urllib.parse import urlparse, ParseResult, urlunparse
 
 
+@functools.lru_cache(maxsize=256)
+def _urlparse_cached(url):
+    """
+    urlparse memoized per url string. Resource pipelines tend to parse the
+    same handful of urls over and over, so repeat parses become a single
+    cache probe. ParseResult is an immutable namedtuple, making it safe to
+    share between callers.
+
+    Args:
+        url (str): Input url to parse
+
+    Returns:
+        urllib.parse.ParseResult: parsed url
+    """
+    return urlparse(url)
+
+
 def maybe_urlparse(url, *args, **kwargs):
     """
     urllib.parse.urlparse wrapper that also accepts ParseResult as an input. In
@@ -17,6 +35,10 @@ def maybe_urlparse(url, *args, **kwargs):
     if isinstance(url, ParseResult):
         return url
 
+    # only the plain default-argument case is cacheable
+    if not args and not kwargs:
+        return _urlparse_cached(url)
+
     return urlparse(url, *args, **kwargs)
 
 
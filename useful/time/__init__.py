@@ -1,9 +1,10 @@
 import logging
-import re
 import datetime
 
 _log = logging.getLogger(__name__)
 
+_UTC = datetime.timezone.utc
+
 
 def string_to_datetime(dt_str):
     """
@@ -19,22 +20,22 @@ def string_to_datetime(dt_str):
     Returns:
         datetime.datetime: An instance created from input string
     """
-    _log.debug("Replacing Z with +00:00, if it exists")
-    dt_str = dt_str.replace('Z', '+00:00')
+    if dt_str.endswith('Z'):
+        dt_str = f"{dt_str[:-1]}+00:00"
     # Add support for "2020-06-02T00:31:57+0000" (HHSS) format by converting it
-    # into python ISO format "2020-06-02T00:31:57+00:00" (HH:SS)
-    _log.debug("Replacing +HHSS with +HH:SS, if it exists")
-    dt_str = re.sub(r"\+([0-9][0-9])([0-9][0-9])$", "+\g<1>:\g<2>", dt_str)  # noqa
-    _log.debug(f"Read date from iso format: {dt_str}")
+    # into python ISO format "2020-06-02T00:31:57+00:00" (HH:SS). A slicing
+    # check is much cheaper than the equivalent re.sub on a hot parsing path
+    if len(dt_str) >= 5 and dt_str[-5] == '+' and dt_str[-4:].isdigit():
+        dt_str = f"{dt_str[:-2]}:{dt_str[-2:]}"
+    _log.debug("Read date from iso format: %s", dt_str)
     try:
-        # fromisoformat only supports 0, 3 and 6 decimal places for subsecond
-        # precision. We want to support an arbitrary number of decimal places.
-        dt = datetime.datetime.strptime(dt_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-    except ValueError:
+        # fromisoformat runs in C and since Python 3.11 accepts arbitrary
+        # subsecond precision, so it handles practically every input here -
+        # strptime stays as a fallback for the formats it does not
         dt = datetime.datetime.fromisoformat(dt_str)
-    _log.debug("Convert to UTC timezone")
-    dt_utc = dt.astimezone(datetime.timezone.utc)
-    _log.debug("Remove timezone info")
+    except ValueError:
+        dt = datetime.datetime.strptime(dt_str, "%Y-%m-%dT%H:%M:%S.%f%z")
+    dt_utc = dt.astimezone(_UTC)
     dt_naive = dt_utc.replace(tzinfo=None)
     return dt_naive
 
@@ -56,16 +57,16 @@ def datetime_to_string(dt, Z=False, timespec='seconds'):
     Returns:
         string: ISO 8601 compatible string with `timespec` precision.
     """
-    dt_utc = dt
-    if dt_utc.tzinfo is None:
-        _log.debug("Pretending input date is UTC: insert UTC as timezone info")
-        dt_utc = dt_utc.replace(tzinfo=datetime.timezone.utc)
+    if dt.tzinfo is None:
+        # offset-naive means UTC here, and the offset string is known up
+        # front - append it directly instead of allocating an intermediate
+        # timezone-aware datetime just to have isoformat render it
+        suffix = 'Z' if Z is True else '+00:00'
+        return f"{dt.isoformat(timespec=timespec)}{suffix}"
 
-    _log.debug("Converting to ISO format string")
-    dt_utc = dt_utc.isoformat(timespec=timespec)
+    dt_utc = dt.isoformat(timespec=timespec)
 
     if Z is True:
-        _log.debug("Replacing +00:00 with Z, if it exists")
         dt_utc = dt_utc.replace('+00:00', 'Z')
 
     return dt_utc